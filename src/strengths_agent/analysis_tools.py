@@ -3,12 +3,262 @@
 These tools perform analysis operations that don't require database access.
 """
 
-from typing import Any, Callable, Dict, List
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# The 34 canonical CliftonStrengths themes (the same closed set listed in
+# prompts.py), interned once so comparisons can index fixed columns instead of
+# hashing theme strings on every call.
+THEMES = (
+    "Achiever",
+    "Activator",
+    "Adaptability",
+    "Analytical",
+    "Arranger",
+    "Belief",
+    "Command",
+    "Communication",
+    "Competition",
+    "Connectedness",
+    "Consistency",
+    "Context",
+    "Deliberative",
+    "Developer",
+    "Discipline",
+    "Empathy",
+    "Focus",
+    "Futuristic",
+    "Harmony",
+    "Ideation",
+    "Includer",
+    "Individualization",
+    "Input",
+    "Intellection",
+    "Learner",
+    "Maximizer",
+    "Positivity",
+    "Relator",
+    "Responsibility",
+    "Restorative",
+    "Self-Assurance",
+    "Significance",
+    "Strategic",
+    "Woo",
+)
+THEME_ID: Dict[str, int] = {theme: col for col, theme in enumerate(THEMES)}
+
+
+# Batches smaller than this don't amortize numba's per-call dispatch cost,
+# so they always take the plain NumPy reduction.
+_NUMBA_MIN_PROFILES = 1024
+
+# Compiled kernel cache: None until first use, False when numba is unavailable
+_l1_kernel: Any = None
+
+
+def _l1_distances(ranks: np.ndarray, target_ranks: np.ndarray) -> np.ndarray:
+    """Compute the L1 rank distance of each row in `ranks` to `target_ranks`.
+
+    For large batches this uses a parallel numba kernel (compiled lazily on
+    first use) that fuses the subtract/abs/sum into a single pass. When numba
+    is not installed, or the batch is small, it falls back to the batched
+    NumPy reduction.
+    """
+    global _l1_kernel
+    if ranks.shape[0] >= _NUMBA_MIN_PROFILES:
+        if _l1_kernel is None:
+            try:
+                from numba import njit, prange
+
+                @njit(parallel=True, cache=True)  # type: ignore[untyped-decorator]
+                def _kernel(ranks: np.ndarray, target_ranks: np.ndarray) -> np.ndarray:
+                    out = np.empty(ranks.shape[0], dtype=np.int32)
+                    for i in prange(ranks.shape[0]):
+                        total = 0
+                        for j in range(ranks.shape[1]):
+                            total += abs(ranks[i, j] - target_ranks[j])
+                        out[i] = total
+                    return out
+
+                _l1_kernel = _kernel
+            except ImportError:
+                _l1_kernel = False
+        if _l1_kernel:
+            return _l1_kernel(ranks, target_ranks)  # type: ignore[no-any-return]
+    return np.abs(ranks - target_ranks).sum(axis=1, dtype=np.int32)  # type: ignore[no-any-return]
+
+
+# Compiled top-K kernel cache, same lifecycle as _l1_kernel
+_topk_kernel: Any = None
+
+
+def _topk_l1(
+    ranks: np.ndarray, target_ranks: np.ndarray, top_k: int
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Select the K closest rows with early-exit pruning.
+
+    Maintains the current K best distances and abandons each row's partial sum
+    as soon as it exceeds the K-th best seen so far, which skips most of the
+    additions once the candidate set warms up. Requires numba; returns None
+    when it is unavailable so the caller can fall back to argpartition.
+    """
+    global _topk_kernel
+    if _topk_kernel is None:
+        try:
+            from numba import njit
+
+            @njit(cache=True)  # type: ignore[untyped-decorator]
+            def _kernel(
+                ranks: np.ndarray, target_ranks: np.ndarray, top_k: int
+            ) -> Tuple[np.ndarray, np.ndarray]:
+                best_idx = np.empty(top_k, dtype=np.int64)
+                best_dist = np.empty(top_k, dtype=np.int32)
+                count = 0
+                threshold = np.int32(np.iinfo(np.int32).max)
+                for i in range(ranks.shape[0]):
+                    total = np.int32(0)
+                    pruned = False
+                    for j in range(ranks.shape[1]):
+                        total += abs(ranks[i, j] - target_ranks[j])
+                        if count == top_k and total > threshold:
+                            pruned = True
+                            break
+                    if pruned:
+                        continue
+                    if count < top_k:
+                        pos = count
+                        count += 1
+                    else:
+                        pos = top_k - 1
+                        if total >= best_dist[pos]:
+                            continue
+                    # Insert into the sorted K-best window
+                    while pos > 0 and best_dist[pos - 1] > total:
+                        best_dist[pos] = best_dist[pos - 1]
+                        best_idx[pos] = best_idx[pos - 1]
+                        pos -= 1
+                    best_dist[pos] = total
+                    best_idx[pos] = i
+                    if count == top_k:
+                        threshold = best_dist[top_k - 1]
+                return best_idx[:count], best_dist[:count]
+
+            _topk_kernel = _kernel
+        except ImportError:
+            _topk_kernel = False
+    if _topk_kernel:
+        return _topk_kernel(ranks, target_ranks, top_k)  # type: ignore[no-any-return]
+    return None
+
+
+# Ranks 1..34 need 6 bits each, so 34 packed ranks fit in 26 bytes versus the
+# 34-byte one-byte-per-rank form
+_RANK_BITS = 6
+_PACKED_LEN = (len(THEMES) * _RANK_BITS + 7) // 8
+_BIT_SHIFTS = np.arange(_RANK_BITS - 1, -1, -1)
+
+
+def _pack_ranks(ranks: np.ndarray) -> bytes:
+    """Pack a 34-entry rank vector into big-endian 6-bit fields."""
+    bits = (ranks[:, None] >> _BIT_SHIFTS) & 1
+    return np.packbits(bits.astype(np.uint8).ravel()).tobytes()
+
+
+def _unpack_ranks(raw: bytes) -> np.ndarray:
+    """Unpack a 6-bit packed rank vector back into an int16 array."""
+    bits = np.unpackbits(
+        np.frombuffer(raw, dtype=np.uint8), count=len(THEMES) * _RANK_BITS
+    )
+    fields = bits.reshape(len(THEMES), _RANK_BITS) << _BIT_SHIFTS
+    return fields.sum(axis=1).astype(np.int16)  # type: ignore[no-any-return]
+
+
+def encode_rank_vector(strengths: List[str]) -> Optional[bytes]:
+    """Encode a canonical 34-theme ranking as a packed bit vector.
+
+    Field ``i`` holds the 1-based rank of ``THEMES[i]`` in 6 bits. Returns
+    None when the list is not exactly the canonical theme set (each theme
+    ranked exactly once), so callers can skip encoding non-canonical profiles.
+    """
+    if len(strengths) != len(THEMES):
+        return None
+    ranks = np.zeros(len(THEMES), dtype=np.uint8)
+    for rank, strength in enumerate(strengths):
+        col = THEME_ID.get(strength)
+        if col is None:
+            return None
+        ranks[col] = rank + 1
+    # A duplicate theme leaves some other theme's rank at 0; encoding such a
+    # list would diverge from what the strengths-list comparison path computes
+    if not ranks.all():
+        return None
+    return _pack_ranks(ranks)
+
+
+def _ranks_from_binary(raw: Any) -> Optional[np.ndarray]:
+    """Decode a stored rank vector, unwrapping boto3's Binary type if needed.
+
+    Accepts both the packed 6-bit form and the earlier one-byte-per-rank form,
+    either as raw bytes or as the hex string that tool responses serialize
+    bytes to (see tools._json_default), so profiles that round-trip through
+    the model keep their fast path.
+    """
+    if raw is None:
+        return None
+    raw = getattr(raw, "value", raw)
+    if isinstance(raw, str):
+        try:
+            raw = bytes.fromhex(raw)
+        except ValueError:
+            return None
+    if not isinstance(raw, (bytes, bytearray)):
+        return None
+    if len(raw) == _PACKED_LEN:
+        return _unpack_ranks(bytes(raw))
+    if len(raw) == len(THEMES):
+        return np.frombuffer(bytes(raw), dtype=np.uint8).astype(np.int16)
+    return None
+
+
+def _theme_columns(target_strengths: List[str]) -> Dict[str, int]:
+    """Get the theme -> column mapping to use for a comparison.
+
+    When the target uses the canonical theme set, the shared module-level
+    interning table is reused so no per-call dict is built. Otherwise a
+    mapping is derived from the target's own theme order, which keeps
+    non-canonical labels working.
+    """
+    if len(target_strengths) == len(THEMES) and all(
+        strength in THEME_ID for strength in target_strengths
+    ):
+        return THEME_ID
+    return {strength: col for col, strength in enumerate(target_strengths)}
+
+
+@functools.lru_cache(maxsize=256)
+def _rank_vector(strengths: Tuple[str, ...]) -> np.ndarray:
+    """Build the rank vector for a strengths tuple, cached across calls.
+
+    Agent conversations often compare the same target against several cohorts
+    in successive tool calls; the cache skips rebuilding the vector each time.
+    The returned array is marked read-only because cached values are shared
+    between callers.
+    """
+    theme_col = _theme_columns(list(strengths))
+    n_cols = len(THEMES) if theme_col is THEME_ID else len(strengths)
+    ranks = np.zeros(n_cols, dtype=np.int16)
+    for rank, strength in enumerate(strengths):
+        ranks[theme_col[strength]] = rank + 1
+    ranks.setflags(write=False)
+    return ranks
 
 
 def compare_profiles(
     target_profile: Dict[str, Any],
     other_profiles: List[Dict[str, Any]],
+    top_k: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Compare a target profile against other profiles and rank by similarity.
 
@@ -23,6 +273,9 @@ def compare_profiles(
             'first_name', 'last_name', and 'strengths' (list of 34 themes in ranked order).
         other_profiles: List of profile dictionaries to compare. Each must include
             'first_name', 'last_name', 'email_address', and 'strengths' (list of 34 themes).
+        top_k: Optional limit on the number of most-similar profiles to return.
+            When set, only the K closest profiles are sorted and returned, which
+            avoids a full sort over large profile sets.
 
     Returns:
         Dictionary with 'success' (bool), 'message' (str), 'target' (str), and 'comparisons'
@@ -43,48 +296,100 @@ def compare_profiles(
                 "message": f"Target profile must include all 34 strengths, found {len(target_strengths)}",
             }
 
-        # Build rank map for target profile
-        target_ranks = {
-            strength: rank + 1 for rank, strength in enumerate(target_strengths)
-        }
+        # Map each theme to a fixed column; the target's rank vector is cached
+        # across calls since targets repeat within a conversation
+        theme_col = _theme_columns(target_strengths)
+        target_ranks = _rank_vector(tuple(target_strengths))
 
-        # Compute similarity for each profile
-        comparisons = []
-        for profile in other_profiles:
-            if not profile.get("strengths"):
-                continue
+        # A theme missing from the other profile scores the maximum penalty of
+        # 34, so initialize each row to target_rank + 34 before scattering in
+        # the ranks that are present.
+        missing_ranks = target_ranks + 34
 
+        # Single pass over the input: keep valid profiles and scatter their
+        # ranks into one (N, themes) matrix
+        # Parallel field lists, extracted once so the output stage doesn't
+        # re-do dict lookups per profile
+        first_names = []
+        last_names = []
+        emails = []
+        strengths_lists = []
+        rank_rows = []
+        # Stored binary rank vectors are keyed by canonical theme id, so they
+        # can only be consumed when the target uses the canonical columns
+        use_binary = theme_col is THEME_ID
+
+        # Filter out incomplete profiles up front so the matrix-building loop
+        # only sees valid rows
+        valid = [
+            profile
+            for profile in other_profiles
+            if profile.get("strengths") and len(profile["strengths"]) >= 34
+        ]
+        for profile in valid:
             profile_strengths = profile["strengths"]
-            if len(profile_strengths) < 34:
-                continue
 
-            # Build rank map for this profile
-            profile_ranks = {
-                strength: rank + 1 for rank, strength in enumerate(profile_strengths)
-            }
+            # Prefer the pre-encoded rank vector when the profile carries one
+            profile_ranks = None
+            if use_binary:
+                profile_ranks = _ranks_from_binary(profile.get("strengths_bin"))
+
+            if profile_ranks is None:
+                # Build this profile's rank vector aligned to the target's columns
+                profile_ranks = missing_ranks.copy()
+                for rank, strength in enumerate(profile_strengths):
+                    col = theme_col.get(strength)
+                    if col is not None:
+                        profile_ranks[col] = rank + 1
 
-            # Compute distance (sum of absolute differences in ranks)
-            distance = 0
-            for strength in target_strengths:
-                if strength in profile_ranks:
-                    distance += abs(target_ranks[strength] - profile_ranks[strength])
+            first_names.append(profile.get("first_name", ""))
+            last_names.append(profile.get("last_name", ""))
+            emails.append(profile.get("email_address", ""))
+            strengths_lists.append(profile_strengths)
+            rank_rows.append(profile_ranks)
+
+        # Compute all distances (sum of absolute differences in ranks) in one
+        # batched pass, then sort ascending (lower is more similar)
+        order: Any = []
+        ordered_distances: Any = []
+        if rank_rows:
+            ranks = np.stack(rank_rows)
+            if top_k is not None and 0 < top_k < len(rank_rows):
+                # The pruned kernel only pays off when most rows can be
+                # discarded; otherwise partition out the K closest and sort
+                # just those
+                selected = None
+                if top_k <= len(rank_rows) // 2:
+                    selected = _topk_l1(ranks, target_ranks, top_k)
+                if selected is not None:
+                    order, ordered_distances = selected
                 else:
-                    # If a strength is missing, add maximum penalty
-                    distance += 34
-
-            # Add profile with similarity score
-            comparisons.append(
-                {
-                    "first_name": profile.get("first_name", ""),
-                    "last_name": profile.get("last_name", ""),
-                    "email_address": profile.get("email_address", ""),
-                    "strengths": profile_strengths,
-                    "similarity_score": distance,
-                }
-            )
-
-        # Sort by similarity score (ascending - lower is more similar)
-        comparisons.sort(key=lambda x: x["similarity_score"])
+                    distances = _l1_distances(ranks, target_ranks)
+                    # Fold the row index into the partition key so ties break
+                    # by input order, matching the full stable sort (and the
+                    # numba kernel, which keeps the first K among equals)
+                    key = distances.astype(np.int64) * len(rank_rows) + np.arange(
+                        len(rank_rows)
+                    )
+                    order = np.argpartition(key, top_k)[:top_k]
+                    order = order[np.argsort(key[order])]
+                    ordered_distances = distances[order]
+            else:
+                distances = _l1_distances(ranks, target_ranks)
+                order = np.argsort(distances, kind="stable")
+                ordered_distances = distances[order]
+
+        # Materialize output dicts only for the sorted result
+        comparisons = [
+            {
+                "first_name": first_names[i],
+                "last_name": last_names[i],
+                "email_address": emails[i],
+                "strengths": strengths_lists[i],
+                "similarity_score": int(ordered_distances[pos]),
+            }
+            for pos, i in enumerate(order)
+        ]
 
         target_name = f"{target_profile.get('first_name', '')} {target_profile.get('last_name', '')}".strip()
         if not target_name:
@@ -92,7 +397,7 @@ def compare_profiles(
 
         return {
             "success": True,
-            "message": f"Compared {len(comparisons)} profile(s) against {target_name}",
+            "message": f"Compared {len(rank_rows)} profile(s) against {target_name}",
             "target": target_name,
             "comparisons": comparisons,
         }
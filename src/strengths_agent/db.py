@@ -1,10 +1,66 @@
 """DynamoDB client wrapper for CliftonStrengths profile management."""
 
+import functools
 import os
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import Binary
+from botocore.config import Config
+
+from strengths_agent.analysis_tools import encode_rank_vector
+
+# Only the attributes the agent's tools actually consume; keeps scan and
+# query payloads (and consumed read capacity) small as profile items grow
+_PROFILE_PROJECTION = "#fn, #ln, email_address, strengths, strengths_bin"
+_PROFILE_ATTR_NAMES = {"#fn": "first_name", "#ln": "last_name"}
+
+
+def _plain(value: Any) -> Any:
+    """Convert boto3 resource-layer values into plain Python types.
+
+    Decimals become int (or float when non-integral) and Binary wrappers
+    become bytes, so downstream analysis never pays for Decimal arithmetic.
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value == int(value) else float(value)
+    if isinstance(value, Binary):
+        return bytes(value.value)
+    if isinstance(value, list):
+        return [_plain(element) for element in value]
+    if isinstance(value, dict):
+        return {key: _plain(element) for key, element in value.items()}
+    return value
+
+
+def _deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a low-level DynamoDB item into plain Python values.
+
+    Only handles the attribute types the profile schema actually uses
+    (strings, lists of strings, numbers, and binary), which skips the
+    per-attribute dispatch of boto3's general TypeDeserializer.
+    """
+    result: Dict[str, Any] = {}
+    for key, tagged in item.items():
+        if "S" in tagged:
+            result[key] = tagged["S"]
+        elif "L" in tagged:
+            result[key] = [
+                element["S"] if "S" in element else next(iter(element.values()))
+                for element in tagged["L"]
+            ]
+        elif "N" in tagged:
+            number = tagged["N"]
+            result[key] = float(number) if "." in number else int(number)
+        elif "B" in tagged:
+            result[key] = tagged["B"]
+        else:
+            result[key] = next(iter(tagged.values()))
+    return result
 
 
 class DynamoDBClient:
@@ -12,6 +68,13 @@ class DynamoDBClient:
 
     def __init__(self):
         """Initialize DynamoDB client with configuration from environment."""
+        # Pool connections so parallel segment scans reuse sockets instead of
+        # opening one per request
+        config = Config(
+            max_pool_connections=int(os.getenv("DDB_POOL", "50")),
+            retries={"max_attempts": 5, "mode": "adaptive"},
+            tcp_keepalive=True,
+        )
         # Create session with profile if specified
         profile_name = os.getenv("AWS_PROFILE")
         if profile_name:
@@ -19,14 +82,25 @@ class DynamoDBClient:
             self.dynamodb = session.resource(
                 "dynamodb",
                 region_name=os.getenv("AWS_REGION", "us-east-1"),
+                config=config,
             )
         else:
             self.dynamodb = boto3.resource(
                 "dynamodb",
                 region_name=os.getenv("AWS_REGION", "us-east-1"),
+                config=config,
             )
         self.table_name = os.getenv("DYNAMODB_TABLE_NAME", "profiles")
         self.table = self.dynamodb.Table(self.table_name)
+        # Low-level client for scans, which avoids the resource layer's
+        # per-attribute TypeDeserializer on large result sets
+        self.client = self.dynamodb.meta.client
+        # Cache successful full-table scans briefly so back-to-back tool calls
+        # within a chat turn don't re-scan the whole table
+        self._scan_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._scan_ttl = float(os.getenv("PROFILES_SCAN_TTL", "30"))
+        # Number of parallel scan segments; 1 keeps the serial scan
+        self._scan_segments = max(1, int(os.getenv("DYNAMODB_SCAN_SEGMENTS", "1")))
 
     def store_profile(
         self,
@@ -47,14 +121,20 @@ class DynamoDBClient:
             Dict with success status and message
         """
         try:
-            self.table.put_item(
-                Item={
-                    "email_address": email_address,
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "strengths": strengths,
-                }
-            )
+            item: Dict[str, Any] = {
+                "email_address": email_address,
+                "first_name": first_name,
+                "last_name": last_name,
+                "strengths": strengths,
+            }
+            # Canonical profiles also get a compact binary rank vector that
+            # compare_profiles can consume without rebuilding rank maps
+            strengths_bin = encode_rank_vector(strengths)
+            if strengths_bin is not None:
+                item["strengths_bin"] = strengths_bin
+            self.table.put_item(Item=item)
+            # The cached scan no longer reflects the table
+            self._scan_cache = None
             return {
                 "success": True,
                 "message": f"Profile stored successfully for {first_name} {last_name} ({email_address})",
@@ -65,9 +145,7 @@ class DynamoDBClient:
                 "message": f"Error storing profile: {str(e)}",
             }
 
-    def get_profile_by_name(
-        self, first_name: str, last_name: str
-    ) -> Dict[str, Any]:
+    def get_profile_by_name(self, first_name: str, last_name: str) -> Dict[str, Any]:
         """Retrieve CliftonStrengths profile(s) by name.
 
         Since first_name + last_name may not be unique, this may return
@@ -85,9 +163,11 @@ class DynamoDBClient:
                 IndexName="name-index",
                 KeyConditionExpression=Key("first_name").eq(first_name)
                 & Key("last_name").eq(last_name),
+                ProjectionExpression=_PROFILE_PROJECTION,
+                ExpressionAttributeNames=_PROFILE_ATTR_NAMES,
             )
 
-            profiles = response.get("Items", [])
+            profiles = [_plain(item) for item in response.get("Items", [])]
 
             if not profiles:
                 return {
@@ -110,6 +190,34 @@ class DynamoDBClient:
                 "profiles": [],
             }
 
+    def _scan_segment(self, segment: int, total_segments: int) -> List[Dict[str, Any]]:
+        """Scan one segment of the table, following its pagination.
+
+        Args:
+            segment: Zero-based index of the segment to scan
+            total_segments: Total number of parallel segments
+
+        Returns:
+            List of items in the segment
+        """
+        kwargs: Dict[str, Any] = {
+            "TableName": self.table_name,
+            "ProjectionExpression": _PROFILE_PROJECTION,
+            "ExpressionAttributeNames": _PROFILE_ATTR_NAMES,
+        }
+        if total_segments > 1:
+            kwargs["Segment"] = segment
+            kwargs["TotalSegments"] = total_segments
+
+        response = self.client.scan(**kwargs)
+        items = [_deserialize_item(item) for item in response.get("Items", [])]
+        while "LastEvaluatedKey" in response:
+            response = self.client.scan(
+                ExclusiveStartKey=response["LastEvaluatedKey"], **kwargs
+            )
+            items.extend(_deserialize_item(item) for item in response.get("Items", []))
+        return items
+
     def get_all_profiles(self) -> Dict[str, Any]:
         """Retrieve all CliftonStrengths profiles from the database.
 
@@ -117,21 +225,36 @@ class DynamoDBClient:
             Dict with all profiles and count
         """
         try:
-            response = self.table.scan()
-            profiles = response.get("Items", [])
+            # Serve from the cache while it is fresh; hand out a copy so a
+            # caller mutating its result list can't corrupt the cached one
+            if self._scan_cache is not None:
+                cached_at, profiles = self._scan_cache
+                if time.monotonic() - cached_at < self._scan_ttl:
+                    return {
+                        "success": True,
+                        "count": len(profiles),
+                        "message": f"Retrieved {len(profiles)} profile(s) from the database",
+                        "profiles": list(profiles),
+                    }
 
-            # Handle pagination if there are many profiles
-            while "LastEvaluatedKey" in response:
-                response = self.table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                profiles.extend(response.get("Items", []))
+            # Scan segments in parallel to overlap the round trips to
+            # DynamoDB; a single segment keeps the plain serial scan
+            if self._scan_segments > 1:
+                with ThreadPoolExecutor(max_workers=self._scan_segments) as executor:
+                    futures = [
+                        executor.submit(self._scan_segment, i, self._scan_segments)
+                        for i in range(self._scan_segments)
+                    ]
+                    profiles = [item for future in futures for item in future.result()]
+            else:
+                profiles = self._scan_segment(0, 1)
 
+            self._scan_cache = (time.monotonic(), profiles)
             return {
                 "success": True,
                 "count": len(profiles),
                 "message": f"Retrieved {len(profiles)} profile(s) from the database",
-                "profiles": profiles,
+                "profiles": list(profiles),
             }
         except Exception as e:
             return {
@@ -141,13 +264,7 @@ class DynamoDBClient:
             }
 
 
-# Singleton instance
-_db_client: Optional[DynamoDBClient] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_db_client() -> DynamoDBClient:
     """Get or create DynamoDB client singleton."""
-    global _db_client
-    if _db_client is None:
-        _db_client = DynamoDBClient()
-    return _db_client
+    return DynamoDBClient()
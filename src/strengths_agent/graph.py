@@ -3,10 +3,13 @@
 Works with a chat model with tool calling support.
 """
 
+import functools
 from datetime import UTC, datetime
-from typing import Dict, List, Literal, cast
+from typing import Dict, List, Literal, Optional, Tuple, cast
 
-from langchain_core.messages import AIMessage
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import Runnable
 from langgraph.graph import StateGraph
 from langgraph.prebuilt import ToolNode
 from langgraph.runtime import Runtime
@@ -20,6 +23,32 @@ from strengths_agent.utils import load_chat_model
 # Combine all tools for model binding
 ALL_TOOLS = DB_TOOLS + ANALYSIS_TOOLS
 
+
+@functools.lru_cache(maxsize=8)
+def _bound_model(model_name: str) -> Runnable[LanguageModelInput, BaseMessage]:
+    """Load a chat model and bind the tools, cached per model name.
+
+    bind_tools re-serializes every tool's JSON schema, so doing it once per
+    model instead of on every graph step keeps that work off the hot path.
+    """
+    return load_chat_model(model_name).bind_tools(ALL_TOOLS)
+
+
+@functools.lru_cache(maxsize=8)
+def _prompt_parts(system_prompt: str) -> Optional[Tuple[str, str]]:
+    """Split a prompt once around its single {system_time} placeholder.
+
+    Returns None when the prompt has any other placeholder (or none at all),
+    in which case the caller falls back to str.format. Splitting avoids
+    re-parsing the multi-kilobyte template on every agent step.
+    """
+    if system_prompt.count("{") == 1 and system_prompt.count("}") == 1:
+        parts = system_prompt.split("{system_time}")
+        if len(parts) == 2:
+            return parts[0], parts[1]
+    return None
+
+
 # Define the function that calls the model
 
 
@@ -38,15 +67,18 @@ async def strengths_agent(
         dict: A dictionary containing the model's response message.
     """
     # Initialize the model with tool binding. Change the model or add more tools here.
-    model = load_chat_model(runtime.context.model).bind_tools(ALL_TOOLS)
+    model = _bound_model(runtime.context.model)
 
     # Format the system prompt. Customize this to change the agent's behavior.
-    system_message = runtime.context.system_prompt.format(
-        system_time=datetime.now(tz=UTC).isoformat()
-    )
+    system_time = datetime.now(tz=UTC).isoformat()
+    parts = _prompt_parts(runtime.context.system_prompt)
+    if parts is not None:
+        system_message = f"{parts[0]}{system_time}{parts[1]}"
+    else:
+        system_message = runtime.context.system_prompt.format(system_time=system_time)
 
     # Get the model's response
-    response = cast( # type: ignore[redundant-cast]
+    response = cast(
         AIMessage,
         await model.ainvoke(
             [{"role": "system", "content": system_message}, *state.messages]
@@ -33,6 +33,7 @@ You have access to four tools:
 
 4. **compare_profiles**: Compare a target profile against other profiles to find similar people
    - Requires: target_profile (dict with first_name, last_name, strengths) and other_profiles (list of profile dicts)
+   - Optional: top_k to return only the K most similar profiles
    - Returns profiles ranked by similarity (most similar first) with similarity scores
    - Lower similarity score means more similar strengths
    - Useful for finding employees with similar strengths profiles or building compatible teams
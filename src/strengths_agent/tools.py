@@ -3,11 +3,43 @@
 Tools allow storing and retrieving employee CliftonStrengths profiles.
 """
 
+import functools
+from decimal import Decimal
 from typing import Any, Callable, Dict, List
 
+import orjson
+
 from strengths_agent.db import get_db_client
 
 
+def _json_default(value: Any) -> Any:
+    """Coerce DynamoDB value types that orjson doesn't handle natively."""
+    if isinstance(value, Decimal):
+        return int(value) if value == int(value) else float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode(response: Dict[str, Any]) -> str:
+    """Serialize a tool response for the model.
+
+    Pre-serializing with orjson keeps large profile payloads off the stdlib
+    json encoder the ToolNode would otherwise run them through.
+    """
+    return orjson.dumps(response, default=_json_default).decode()
+
+
+def _serialized(tool: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a tool so the graph receives its response pre-serialized."""
+
+    @functools.wraps(tool)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        return _encode(tool(*args, **kwargs))
+
+    return wrapper
+
+
 def store_profile(
     first_name: str,
     last_name: str,
@@ -67,4 +99,10 @@ def get_all_profiles() -> Dict[str, Any]:
     return db.get_all_profiles()
 
 
-TOOLS: List[Callable[..., Any]] = [store_profile, get_profile, get_all_profiles]
+# The plain functions above return dicts for direct (and test) use; the graph
+# gets wrappers that hand the ToolNode a pre-serialized JSON string
+TOOLS: List[Callable[..., Any]] = [
+    _serialized(store_profile),
+    _serialized(get_profile),
+    _serialized(get_all_profiles),
+]
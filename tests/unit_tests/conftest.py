@@ -0,0 +1,214 @@
+"""Shared fixtures and fakes for the unit test suite."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from strengths_agent.db import DynamoDBClient
+
+# Canonical sample rankings shared across tests
+SAMPLE_STRENGTHS = [f"Strength{i}" for i in range(1, 35)]
+LEARNER_34 = ["Learner"] * 34
+ACHIEVER_34 = ["Achiever"] * 34
+
+
+@pytest.fixture(scope="session")
+def all_34_strengths():
+    """The canonical 34 CliftonStrengths theme names, built once per session."""
+    return (
+        "Achiever",
+        "Activator",
+        "Adaptability",
+        "Analytical",
+        "Arranger",
+        "Belief",
+        "Command",
+        "Communication",
+        "Competition",
+        "Connectedness",
+        "Consistency",
+        "Context",
+        "Deliberative",
+        "Developer",
+        "Discipline",
+        "Empathy",
+        "Focus",
+        "Futuristic",
+        "Harmony",
+        "Ideation",
+        "Includer",
+        "Individualization",
+        "Input",
+        "Intellection",
+        "Learner",
+        "Maximizer",
+        "Positivity",
+        "Relator",
+        "Responsibility",
+        "Restorative",
+        "Self-Assurance",
+        "Significance",
+        "Strategic",
+        "Woo",
+    )
+
+
+class FakeTable:
+    """Minimal stand-in for a boto3 Table that records calls."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.put_item_calls = []
+        self.query_calls = []
+        self.put_item_exc = None
+        self.query_exc = None
+        self.query_return = {"Items": []}
+
+    def put_item(self, **kwargs):
+        self.put_item_calls.append(kwargs)
+        if self.put_item_exc is not None:
+            raise self.put_item_exc
+        return {}
+
+    def query(self, **kwargs):
+        self.query_calls.append(kwargs)
+        if self.query_exc is not None:
+            raise self.query_exc
+        return self.query_return
+
+
+class FakeClient:
+    """Minimal stand-in for the low-level DynamoDB client."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.scan_calls = []
+        self.scan_exc = None
+        # Responses are consumed in order; the last one repeats
+        self.scan_returns = [{"Items": []}]
+
+    def scan(self, **kwargs):
+        self.scan_calls.append(kwargs)
+        if self.scan_exc is not None:
+            raise self.scan_exc
+        if len(self.scan_returns) > 1:
+            return self.scan_returns.pop(0)
+        return self.scan_returns[0]
+
+
+class FakeDBClient:
+    """Minimal stand-in for DynamoDBClient as seen by the tool layer."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.store_profile_ret = {}
+        self.get_profile_by_name_ret = {}
+        self.get_all_profiles_ret = {}
+        self.store_calls = []
+        self.get_calls = []
+        self.get_all_calls = []
+
+    def store_profile(self, *args, **kwargs):
+        self.store_calls.append((args, kwargs))
+        return self.store_profile_ret
+
+    def get_profile_by_name(self, *args, **kwargs):
+        self.get_calls.append((args, kwargs))
+        return self.get_profile_by_name_ret
+
+    def get_all_profiles(self, *args, **kwargs):
+        self.get_all_calls.append((args, kwargs))
+        return self.get_all_profiles_ret
+
+
+class _FakeResource:
+    """Resource object exposing just Table() and meta.client."""
+
+    def __init__(self, owner):
+        self._owner = owner
+        self.meta = SimpleNamespace(client=owner.client)
+
+    def Table(self, name):
+        return self._owner.table
+
+
+class _FakeSession:
+    def __init__(self, owner):
+        self._owner = owner
+
+    def resource(self, service, **kwargs):
+        return _FakeResource(self._owner)
+
+
+class FakeBoto3:
+    """Minimal stand-in for the boto3 module surface db.py touches."""
+
+    def __init__(self):
+        self.table = FakeTable()
+        self.client = FakeClient()
+        self.resource_calls = []
+        self.session_calls = []
+
+    def reset(self):
+        self.table.reset()
+        self.client.reset()
+        self.resource_calls = []
+        self.session_calls = []
+
+    def resource(self, service, **kwargs):
+        self.resource_calls.append((service, kwargs))
+        return _FakeResource(self)
+
+    def Session(self, **kwargs):
+        self.session_calls.append(kwargs)
+        return _FakeSession(self)
+
+
+@pytest.fixture(scope="session")
+def mock_dynamodb_resource():
+    """Install a fake boto3 module, shared across the session."""
+    mp = pytest.MonkeyPatch()
+    fake_boto3 = FakeBoto3()
+    mp.setattr("strengths_agent.db.boto3", fake_boto3)
+    yield fake_boto3, fake_boto3.table
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
+def db_client(mock_dynamodb_resource):
+    """Create a single DynamoDB client instance against the fake boto3."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("DYNAMODB_TABLE_NAME", "test-profiles")
+    client = DynamoDBClient()
+    mp.undo()
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_dynamodb_resource, db_client):
+    """Clear recorded calls, configured behavior, and caches before each test."""
+    fake_boto3, _ = mock_dynamodb_resource
+    fake_boto3.reset()
+    db_client._scan_cache = None
+
+
+@pytest.fixture(scope="session")
+def mock_db_client():
+    """Create a fake database client, shared across the session."""
+    mp = pytest.MonkeyPatch()
+    fake_client = FakeDBClient()
+    mp.setattr("strengths_agent.tools.get_db_client", lambda: fake_client)
+    yield fake_client
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def _reset_db_client(mock_db_client):
+    """Clear recorded calls and configured returns before each test."""
+    mock_db_client.reset()
@@ -2,7 +2,62 @@
 
 import pytest
 
-from strengths_agent.analysis_tools import compare_profiles
+from strengths_agent.analysis_tools import THEMES, compare_profiles, encode_rank_vector
+
+
+class TestEncodeRankVector:
+    """Test suite for the encode_rank_vector helper."""
+
+    def test_encode_rank_vector_rejects_non_permutations(self):
+        """Test that lists not ranking each canonical theme once return None."""
+        assert encode_rank_vector(["Learner"] * 34) is None
+        # Right length and all-canonical names, but Learner twice and no Woo
+        assert encode_rank_vector(list(THEMES[:-1]) + ["Learner"]) is None
+
+    def test_encode_rank_vector_rejects_unknown_themes(self):
+        """Test that non-canonical theme names return None."""
+        assert encode_rank_vector([f"Strength{i}" for i in range(1, 35)]) is None
+
+    def test_encoded_vector_matches_list_path(self, all_34_strengths):
+        """Test that comparing via strengths_bin scores like the list path."""
+        strengths = list(all_34_strengths)
+        other = strengths[5:] + strengths[:5]
+        target = {
+            "first_name": "Alice",
+            "last_name": "Smith",
+            "strengths": strengths,
+        }
+
+        others = [
+            {
+                "first_name": "List",
+                "last_name": "Path",
+                "email_address": "list@example.com",
+                "strengths": other,
+            },
+            {
+                "first_name": "Binary",
+                "last_name": "Path",
+                "email_address": "binary@example.com",
+                "strengths": other,
+                "strengths_bin": encode_rank_vector(other),
+            },
+            {
+                "first_name": "Hex",
+                "last_name": "Path",
+                "email_address": "hex@example.com",
+                "strengths": other,
+                # Tool responses serialize bytes to hex, so vectors fed back
+                # through the model arrive as strings
+                "strengths_bin": encode_rank_vector(other).hex(),
+            },
+        ]
+
+        result = compare_profiles(target, others)
+
+        assert result["success"] is True
+        scores = [c["similarity_score"] for c in result["comparisons"]]
+        assert scores[0] == scores[1] == scores[2]
 
 
 class TestCompareProfilesTool:
@@ -276,6 +331,65 @@ class TestCompareProfilesTool:
         assert comparison["email_address"] == "bob@example.com"
         assert len(comparison["strengths"]) == 34
 
+    @pytest.mark.parametrize("top_k", [1, 2, 10])
+    def test_compare_profiles_top_k(self, top_k):
+        """Test that top_k returns the first K entries of the full-sort result."""
+        strengths = [f"S{i}" for i in range(1, 35)]
+        target = {
+            "first_name": "Alice",
+            "last_name": "Smith",
+            "strengths": strengths,
+        }
+
+        # Swapping rank 1 with rank k+1 gives a distinct distance of 2k per
+        # profile, so the expected ordering is unambiguous
+        others = []
+        for k in range(1, 6):
+            swapped = list(strengths)
+            swapped[0], swapped[k] = swapped[k], swapped[0]
+            others.append(
+                {
+                    "first_name": f"Person{k}",
+                    "last_name": "Swapped",
+                    "email_address": f"person{k}@example.com",
+                    "strengths": swapped,
+                }
+            )
+
+        full = compare_profiles(target, others)
+        limited = compare_profiles(target, others, top_k=top_k)
+
+        assert limited["success"] is True
+        assert limited["comparisons"] == full["comparisons"][:top_k]
+
+    @pytest.mark.parametrize("top_k", [3, 5])
+    def test_compare_profiles_top_k_with_tied_distances(self, top_k):
+        """Test that tied distances keep the full-sort order under top_k."""
+        strengths = [f"S{i}" for i in range(1, 35)]
+        target = {
+            "first_name": "Alice",
+            "last_name": "Smith",
+            "strengths": strengths,
+        }
+
+        # Eleven identical profiles: every distance ties at 0, so the result
+        # order is decided purely by the tie-break
+        others = [
+            {
+                "first_name": f"Person{k}",
+                "last_name": "Identical",
+                "email_address": f"person{k}@example.com",
+                "strengths": strengths,
+            }
+            for k in range(1, 12)
+        ]
+
+        full = compare_profiles(target, others)
+        limited = compare_profiles(target, others, top_k=top_k)
+
+        assert limited["success"] is True
+        assert limited["comparisons"] == full["comparisons"][:top_k]
+
     def test_compare_profiles_large_distance(self):
         """Test profiles with maximum possible distance."""
         # Create completely opposite profiles
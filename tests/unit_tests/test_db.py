@@ -1,55 +1,65 @@
 """Unit tests for DynamoDB client functionality."""
 
-import os
-from unittest.mock import MagicMock, patch
-
 import pytest
 
 from strengths_agent.db import DynamoDBClient, get_db_client
 
+from .conftest import ACHIEVER_34, LEARNER_34, SAMPLE_STRENGTHS
+
+
+def _ddb_item(email, first_name, last_name, strengths):
+    """Build a profile item in DynamoDB's low-level wire format."""
+    return {
+        "email_address": {"S": email},
+        "first_name": {"S": first_name},
+        "last_name": {"S": last_name},
+        "strengths": {"L": [{"S": s} for s in strengths]},
+    }
+
+
+PROFILE_JOHN = {
+    "email_address": "john.doe@example.com",
+    "first_name": "John",
+    "last_name": "Doe",
+    "strengths": SAMPLE_STRENGTHS,
+}
+PROFILE_JOHN_2 = {
+    "email_address": "john.doe2@example.com",
+    "first_name": "John",
+    "last_name": "Doe",
+    "strengths": ACHIEVER_34,
+}
+
 
 class TestDynamoDBClient:
     """Test suite for DynamoDB client operations."""
 
-    @pytest.fixture
-    def mock_dynamodb_resource(self):
-        """Create a mock DynamoDB resource."""
-        with patch("strengths_agent.db.boto3") as mock_boto3:
-            mock_resource = MagicMock()
-            mock_table = MagicMock()
-            mock_resource.Table.return_value = mock_table
-            mock_boto3.resource.return_value = mock_resource
-            mock_boto3.Session.return_value.resource.return_value = mock_resource
-            yield mock_boto3, mock_table
-
-    @pytest.fixture
-    def db_client(self, mock_dynamodb_resource):
-        """Create a DynamoDB client instance with mocked AWS connection."""
-        _, _ = mock_dynamodb_resource
-        with patch.dict(os.environ, {"DYNAMODB_TABLE_NAME": "test-profiles"}):
-            return DynamoDBClient()
-
-    def test_client_initialization_without_profile(self, mock_dynamodb_resource):
+    def test_client_initialization_without_profile(self, mock_dynamodb_resource, monkeypatch):
         """Test client initializes correctly without AWS profile."""
         mock_boto3, _ = mock_dynamodb_resource
-        with patch.dict(os.environ, {"AWS_REGION": "us-west-2", "DYNAMODB_TABLE_NAME": "test-profiles"}, clear=True):
-            client = DynamoDBClient()
-            mock_boto3.resource.assert_called_once_with("dynamodb", region_name="us-west-2")
-            assert client.table_name == "test-profiles"
-
-    def test_client_initialization_with_profile(self, mock_dynamodb_resource):
+        monkeypatch.delenv("AWS_PROFILE", raising=False)
+        monkeypatch.setenv("AWS_REGION", "us-west-2")
+        monkeypatch.setenv("DYNAMODB_TABLE_NAME", "test-profiles")
+        client = DynamoDBClient()
+        assert len(mock_boto3.resource_calls) == 1
+        service, kwargs = mock_boto3.resource_calls[0]
+        assert service == "dynamodb"
+        assert kwargs["region_name"] == "us-west-2"
+        assert client.table_name == "test-profiles"
+
+    def test_client_initialization_with_profile(self, mock_dynamodb_resource, monkeypatch):
         """Test client initializes correctly with AWS profile."""
         mock_boto3, _ = mock_dynamodb_resource
-        with patch.dict(os.environ, {"AWS_PROFILE": "test-profile", "AWS_REGION": "us-east-1"}):
-            client = DynamoDBClient()
-            mock_boto3.Session.assert_called_once_with(profile_name="test-profile")
+        monkeypatch.setenv("AWS_PROFILE", "test-profile")
+        monkeypatch.setenv("AWS_REGION", "us-east-1")
+        DynamoDBClient()
+        assert mock_boto3.session_calls == [{"profile_name": "test-profile"}]
 
     def test_store_profile_success(self, db_client, mock_dynamodb_resource):
         """Test successfully storing a profile."""
         _, mock_table = mock_dynamodb_resource
-        mock_table.put_item.return_value = {}
 
-        strengths = [f"Strength{i}" for i in range(1, 35)]
+        strengths = SAMPLE_STRENGTHS
         result = db_client.store_profile(
             first_name="John",
             last_name="Doe",
@@ -60,213 +70,193 @@ class TestDynamoDBClient:
         assert result["success"] is True
         assert "successfully" in result["message"].lower()
         assert "John Doe" in result["message"]
-        
-        # Verify put_item was called with correct data
-        mock_table.put_item.assert_called_once()
-        call_args = mock_table.put_item.call_args
-        assert call_args[1]["Item"]["first_name"] == "John"
-        assert call_args[1]["Item"]["last_name"] == "Doe"
-        assert call_args[1]["Item"]["email_address"] == "john.doe@example.com"
-        assert len(call_args[1]["Item"]["strengths"]) == 34
-
-    def test_store_profile_failure(self, db_client, mock_dynamodb_resource):
-        """Test handling of store profile failure."""
-        _, mock_table = mock_dynamodb_resource
-        mock_table.put_item.side_effect = Exception("DynamoDB error")
 
-        result = db_client.store_profile(
-            first_name="Jane",
-            last_name="Smith",
-            email_address="jane.smith@example.com",
-            strengths=["Learner"] * 34,
-        )
+        # Verify put_item was called with correct data
+        assert len(mock_table.put_item_calls) == 1
+        item = mock_table.put_item_calls[0]["Item"]
+        assert item["first_name"] == "John"
+        assert item["last_name"] == "Doe"
+        assert item["email_address"] == "john.doe@example.com"
+        assert len(item["strengths"]) == 34
+
+    @pytest.mark.parametrize(
+        "exc_attr,call,err",
+        [
+            pytest.param(
+                "put_item_exc",
+                lambda c: c.store_profile("Jane", "Smith", "jane.smith@example.com", LEARNER_34),
+                "DynamoDB error",
+                id="store-profile",
+            ),
+            pytest.param(
+                "query_exc",
+                lambda c: c.get_profile_by_name("John", "Doe"),
+                "Query failed",
+                id="get-profile-by-name",
+            ),
+            pytest.param(
+                "scan_exc",
+                lambda c: c.get_all_profiles(),
+                "Scan failed",
+                id="get-all-profiles",
+            ),
+        ],
+    )
+    def test_error_paths(self, db_client, mock_dynamodb_resource, exc_attr, call, err):
+        """Test that backend exceptions surface as error result dicts."""
+        mock_boto3, mock_table = mock_dynamodb_resource
+        target = mock_table if hasattr(mock_table, exc_attr) else mock_boto3.client
+        setattr(target, exc_attr, Exception(err))
+
+        result = call(db_client)
 
         assert result["success"] is False
         assert "error" in result["message"].lower()
-        assert "DynamoDB error" in result["message"]
-
-    def test_get_profile_by_name_found_single(self, db_client, mock_dynamodb_resource):
-        """Test retrieving a single profile by name."""
-        _, mock_table = mock_dynamodb_resource
-        
-        mock_profile = {
-            "email_address": "john.doe@example.com",
-            "first_name": "John",
-            "last_name": "Doe",
-            "strengths": [f"Strength{i}" for i in range(1, 35)],
-        }
-        mock_table.query.return_value = {"Items": [mock_profile]}
-
-        result = db_client.get_profile_by_name("John", "Doe")
-
-        assert result["success"] is True
-        assert result["count"] == 1
-        assert len(result["profiles"]) == 1
-        assert result["profiles"][0]["email_address"] == "john.doe@example.com"
-        assert "Found 1 profile" in result["message"]
-
-    def test_get_profile_by_name_found_multiple(self, db_client, mock_dynamodb_resource):
-        """Test retrieving multiple profiles with same name."""
+        assert err in result["message"]
+        assert result.get("profiles", []) == []
+
+    @pytest.mark.parametrize(
+        "items,expected_count,msg_substr",
+        [
+            pytest.param([PROFILE_JOHN], 1, "Found 1 profile", id="single"),
+            pytest.param(
+                [PROFILE_JOHN, PROFILE_JOHN_2], 2, "Found 2 profile", id="multiple"
+            ),
+            pytest.param([], 0, "No profile found", id="not-found"),
+        ],
+    )
+    def test_get_profile_by_name(
+        self, db_client, mock_dynamodb_resource, items, expected_count, msg_substr
+    ):
+        """Test retrieving profiles by name across result shapes."""
         _, mock_table = mock_dynamodb_resource
-        
-        mock_profiles = [
-            {
-                "email_address": "john.doe1@example.com",
-                "first_name": "John",
-                "last_name": "Doe",
-                "strengths": ["Learner"] * 34,
-            },
-            {
-                "email_address": "john.doe2@example.com",
-                "first_name": "John",
-                "last_name": "Doe",
-                "strengths": ["Achiever"] * 34,
-            },
-        ]
-        mock_table.query.return_value = {"Items": mock_profiles}
+        mock_table.query_return = {"Items": items}
 
         result = db_client.get_profile_by_name("John", "Doe")
 
         assert result["success"] is True
-        assert result["count"] == 2
-        assert len(result["profiles"]) == 2
-        assert "Found 2 profile" in result["message"]
-
-    def test_get_profile_by_name_not_found(self, db_client, mock_dynamodb_resource):
-        """Test retrieving a profile that doesn't exist."""
-        _, mock_table = mock_dynamodb_resource
-        mock_table.query.return_value = {"Items": []}
-
-        result = db_client.get_profile_by_name("Nonexistent", "Person")
-
-        assert result["success"] is True
-        assert result["count"] == 0
-        assert len(result["profiles"]) == 0
-        assert "No profile found" in result["message"]
-
-    def test_get_profile_by_name_query_error(self, db_client, mock_dynamodb_resource):
-        """Test handling of query errors."""
-        _, mock_table = mock_dynamodb_resource
-        mock_table.query.side_effect = Exception("Query failed")
-
-        result = db_client.get_profile_by_name("John", "Doe")
-
-        assert result["success"] is False
-        assert "error" in result["message"].lower()
-        assert "Query failed" in result["message"]
-        assert result["profiles"] == []
-
-    def test_get_all_profiles_success(self, db_client, mock_dynamodb_resource):
-        """Test retrieving all profiles successfully."""
-        _, mock_table = mock_dynamodb_resource
-        
-        mock_profiles = [
-            {
-                "email_address": "alice@example.com",
-                "first_name": "Alice",
-                "last_name": "Smith",
-                "strengths": [f"Strength{i}" for i in range(1, 35)],
-            },
-            {
-                "email_address": "bob@example.com",
-                "first_name": "Bob",
-                "last_name": "Jones",
-                "strengths": ["Learner"] * 34,
-            },
-        ]
-        mock_table.scan.return_value = {"Items": mock_profiles}
+        assert result["count"] == expected_count
+        assert len(result["profiles"]) == expected_count
+        assert msg_substr in result["message"]
+        emails = [p["email_address"] for p in result["profiles"]]
+        assert emails == [p["email_address"] for p in items]
+
+    @pytest.mark.parametrize(
+        "scan_returns,expected_count,expected_scans,msg_substr",
+        [
+            pytest.param(
+                [
+                    {
+                        "Items": [
+                            _ddb_item(
+                                "alice@example.com", "Alice", "Smith", SAMPLE_STRENGTHS
+                            ),
+                            _ddb_item("bob@example.com", "Bob", "Jones", LEARNER_34),
+                        ]
+                    }
+                ],
+                2,
+                1,
+                "Retrieved 2 profile",
+                id="single-page",
+            ),
+            pytest.param(
+                [
+                    {
+                        "Items": [
+                            _ddb_item("user1@example.com", "User", "One", ACHIEVER_34)
+                        ],
+                        "LastEvaluatedKey": {"email_address": {"S": "user1@example.com"}},
+                    },
+                    {
+                        "Items": [
+                            _ddb_item("user2@example.com", "User", "Two", LEARNER_34)
+                        ]
+                    },
+                ],
+                2,
+                2,
+                "Retrieved 2 profile",
+                id="paginated",
+            ),
+            pytest.param([{"Items": []}], 0, 1, "Retrieved 0 profile", id="empty"),
+        ],
+    )
+    def test_get_all_profiles(
+        self,
+        db_client,
+        mock_dynamodb_resource,
+        scan_returns,
+        expected_count,
+        expected_scans,
+        msg_substr,
+    ):
+        """Test retrieving all profiles across scan shapes."""
+        mock_boto3, _ = mock_dynamodb_resource
+        mock_boto3.client.scan_returns = list(scan_returns)
 
         result = db_client.get_all_profiles()
 
         assert result["success"] is True
-        assert result["count"] == 2
-        assert len(result["profiles"]) == 2
-        assert "Retrieved 2 profile" in result["message"]
-
-    def test_get_all_profiles_with_pagination(self, db_client, mock_dynamodb_resource):
-        """Test retrieving all profiles with pagination."""
-        _, mock_table = mock_dynamodb_resource
-        
-        first_batch = [
-            {
-                "email_address": "user1@example.com",
-                "first_name": "User",
-                "last_name": "One",
-                "strengths": ["Achiever"] * 34,
-            }
-        ]
-        second_batch = [
-            {
-                "email_address": "user2@example.com",
-                "first_name": "User",
-                "last_name": "Two",
-                "strengths": ["Learner"] * 34,
-            }
-        ]
-        
-        # Mock pagination
-        mock_table.scan.side_effect = [
-            {"Items": first_batch, "LastEvaluatedKey": {"email_address": "user1@example.com"}},
-            {"Items": second_batch},
+        assert result["count"] == expected_count
+        assert len(result["profiles"]) == expected_count
+        assert msg_substr in result["message"]
+        assert len(mock_boto3.client.scan_calls) == expected_scans
+
+    def test_get_all_profiles_serves_cache_within_ttl(
+        self, db_client, mock_dynamodb_resource
+    ):
+        """Test that a repeat call within the TTL skips the table scan."""
+        mock_boto3, _ = mock_dynamodb_resource
+        mock_boto3.client.scan_returns = [
+            {"Items": [_ddb_item("alice@example.com", "Alice", "Smith", SAMPLE_STRENGTHS)]}
         ]
 
-        result = db_client.get_all_profiles()
-
-        assert result["success"] is True
-        assert result["count"] == 2
-        assert len(result["profiles"]) == 2
-        assert mock_table.scan.call_count == 2
-
-    def test_get_all_profiles_empty(self, db_client, mock_dynamodb_resource):
-        """Test retrieving all profiles when database is empty."""
-        _, mock_table = mock_dynamodb_resource
-        
-        mock_table.scan.return_value = {"Items": []}
-
-        result = db_client.get_all_profiles()
-
-        assert result["success"] is True
-        assert result["count"] == 0
-        assert len(result["profiles"]) == 0
-        assert "Retrieved 0 profile" in result["message"]
-
-    def test_get_all_profiles_error(self, db_client, mock_dynamodb_resource):
-        """Test error handling when scan fails."""
-        _, mock_table = mock_dynamodb_resource
-        
-        mock_table.scan.side_effect = Exception("Scan failed")
+        first = db_client.get_all_profiles()
+        second = db_client.get_all_profiles()
+
+        assert first["success"] is True
+        assert second["success"] is True
+        assert second["profiles"] == first["profiles"]
+        assert len(mock_boto3.client.scan_calls) == 1
+        # The cached list is copied on the way out, so mutating one result
+        # must not leak into later calls
+        second["profiles"].clear()
+        assert db_client.get_all_profiles()["count"] == 1
+
+    def test_store_profile_invalidates_scan_cache(
+        self, db_client, mock_dynamodb_resource
+    ):
+        """Test that storing a profile forces the next call to re-scan."""
+        mock_boto3, _ = mock_dynamodb_resource
 
-        result = db_client.get_all_profiles()
+        db_client.get_all_profiles()
+        db_client.store_profile("John", "Doe", "john.doe@example.com", SAMPLE_STRENGTHS)
+        db_client.get_all_profiles()
 
-        assert result["success"] is False
-        assert "error" in result["message"].lower()
-        assert "Scan failed" in result["message"]
-        assert result["profiles"] == []
+        assert len(mock_boto3.client.scan_calls) == 2
 
 
 class TestGetDBClient:
     """Test suite for the get_db_client singleton function."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_singleton(self, mock_dynamodb_resource):
+        """Reset the cached client so each test constructs its own."""
+        get_db_client.cache_clear()
+        yield
+        get_db_client.cache_clear()
+
     def test_get_db_client_singleton(self):
         """Test that get_db_client returns the same instance."""
-        with patch("strengths_agent.db.boto3"):
-            # Reset the singleton
-            import strengths_agent.db
-            strengths_agent.db._db_client = None
-            
-            client1 = get_db_client()
-            client2 = get_db_client()
-            
-            assert client1 is client2
+        client1 = get_db_client()
+        client2 = get_db_client()
+
+        assert client1 is client2
 
     def test_get_db_client_creates_instance(self):
         """Test that get_db_client creates an instance if none exists."""
-        with patch("strengths_agent.db.boto3"):
-            # Reset the singleton
-            import strengths_agent.db
-            strengths_agent.db._db_client = None
-            
-            client = get_db_client()
-            
-            assert client is not None
-            assert isinstance(client, DynamoDBClient)
+        client = get_db_client()
+
+        assert client is not None
+        assert isinstance(client, DynamoDBClient)
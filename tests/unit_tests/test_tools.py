@@ -1,31 +1,21 @@
 """Unit tests for CliftonStrengths tools."""
 
-from unittest.mock import MagicMock, patch
-
-import pytest
-
 from strengths_agent.tools import get_all_profiles, get_profile, store_profile
 
+from .conftest import ACHIEVER_34, LEARNER_34, SAMPLE_STRENGTHS
+
 
 class TestStoreProfileTool:
     """Test suite for the store_profile tool."""
 
-    @pytest.fixture
-    def mock_db_client(self):
-        """Create a mock database client."""
-        with patch("strengths_agent.tools.get_db_client") as mock_get_client:
-            mock_client = MagicMock()
-            mock_get_client.return_value = mock_client
-            yield mock_client
-
     def test_store_profile_success(self, mock_db_client):
         """Test storing a profile successfully."""
-        mock_db_client.store_profile.return_value = {
+        mock_db_client.store_profile_ret = {
             "success": True,
             "message": "Profile stored successfully for Arthur Torres (arthur@example.com)",
         }
 
-        strengths = [f"Strength{i}" for i in range(1, 35)]
+        strengths = SAMPLE_STRENGTHS
         result = store_profile(
             first_name="Arthur",
             last_name="Torres",
@@ -35,42 +25,32 @@ class TestStoreProfileTool:
 
         assert result["success"] is True
         assert "successfully" in result["message"].lower()
-        mock_db_client.store_profile.assert_called_once_with(
-            "Arthur", "Torres", "arthur@example.com", strengths
-        )
+        assert mock_db_client.store_calls == [
+            (("Arthur", "Torres", "arthur@example.com", strengths), {})
+        ]
 
-    def test_store_profile_with_all_34_strengths(self, mock_db_client):
+    def test_store_profile_with_all_34_strengths(self, mock_db_client, all_34_strengths):
         """Test that store_profile accepts exactly 34 strengths."""
-        mock_db_client.store_profile.return_value = {
+        mock_db_client.store_profile_ret = {
             "success": True,
             "message": "Profile stored successfully",
         }
 
-        all_strengths = [
-            "Achiever", "Activator", "Adaptability", "Analytical", "Arranger",
-            "Belief", "Command", "Communication", "Competition", "Connectedness",
-            "Consistency", "Context", "Deliberative", "Developer", "Discipline",
-            "Empathy", "Focus", "Futuristic", "Harmony", "Ideation",
-            "Includer", "Individualization", "Input", "Intellection", "Learner",
-            "Maximizer", "Positivity", "Relator", "Responsibility", "Restorative",
-            "Self-Assurance", "Significance", "Strategic", "Woo",
-        ]
-
         result = store_profile(
             first_name="Test",
             last_name="User",
             email_address="test@example.com",
-            strengths=all_strengths,
+            strengths=list(all_34_strengths),
         )
 
         assert result["success"] is True
         # Verify the tool passed the strengths list correctly
-        call_args = mock_db_client.store_profile.call_args
-        assert len(call_args[0][3]) == 34
+        args, _ = mock_db_client.store_calls[0]
+        assert len(args[3]) == 34
 
     def test_store_profile_failure(self, mock_db_client):
         """Test handling of store profile failure."""
-        mock_db_client.store_profile.return_value = {
+        mock_db_client.store_profile_ret = {
             "success": False,
             "message": "Error storing profile: Connection timeout",
         }
@@ -79,7 +59,7 @@ class TestStoreProfileTool:
             first_name="Jane",
             last_name="Doe",
             email_address="jane@example.com",
-            strengths=["Learner"] * 34,
+            strengths=LEARNER_34,
         )
 
         assert result["success"] is False
@@ -89,17 +69,9 @@ class TestStoreProfileTool:
 class TestGetProfileTool:
     """Test suite for the get_profile tool."""
 
-    @pytest.fixture
-    def mock_db_client(self):
-        """Create a mock database client."""
-        with patch("strengths_agent.tools.get_db_client") as mock_get_client:
-            mock_client = MagicMock()
-            mock_get_client.return_value = mock_client
-            yield mock_client
-
     def test_get_profile_found_single(self, mock_db_client):
         """Test retrieving a single profile."""
-        mock_db_client.get_profile_by_name.return_value = {
+        mock_db_client.get_profile_by_name_ret = {
             "success": True,
             "count": 1,
             "message": "Found 1 profile(s) for Arthur Torres",
@@ -119,11 +91,11 @@ class TestGetProfileTool:
         assert result["count"] == 1
         assert len(result["profiles"]) == 1
         assert result["profiles"][0]["email_address"] == "arthur@example.com"
-        mock_db_client.get_profile_by_name.assert_called_once_with("Arthur", "Torres")
+        assert mock_db_client.get_calls == [(("Arthur", "Torres"), {})]
 
     def test_get_profile_found_multiple(self, mock_db_client):
         """Test retrieving multiple profiles with the same name."""
-        mock_db_client.get_profile_by_name.return_value = {
+        mock_db_client.get_profile_by_name_ret = {
             "success": True,
             "count": 2,
             "message": "Found 2 profile(s) for John Smith",
@@ -132,13 +104,13 @@ class TestGetProfileTool:
                     "email_address": "john.smith1@example.com",
                     "first_name": "John",
                     "last_name": "Smith",
-                    "strengths": ["Learner"] * 34,
+                    "strengths": LEARNER_34,
                 },
                 {
                     "email_address": "john.smith2@example.com",
                     "first_name": "John",
                     "last_name": "Smith",
-                    "strengths": ["Achiever"] * 34,
+                    "strengths": ACHIEVER_34,
                 },
             ],
         }
@@ -155,7 +127,7 @@ class TestGetProfileTool:
 
     def test_get_profile_not_found(self, mock_db_client):
         """Test retrieving a profile that doesn't exist."""
-        mock_db_client.get_profile_by_name.return_value = {
+        mock_db_client.get_profile_by_name_ret = {
             "success": True,
             "count": 0,
             "message": "No profile found for Nonexistent Person",
@@ -171,7 +143,7 @@ class TestGetProfileTool:
 
     def test_get_profile_error(self, mock_db_client):
         """Test handling of retrieval errors."""
-        mock_db_client.get_profile_by_name.return_value = {
+        mock_db_client.get_profile_by_name_ret = {
             "success": False,
             "message": "Error retrieving profile: Database unavailable",
             "profiles": [],
@@ -185,9 +157,9 @@ class TestGetProfileTool:
 
     def test_get_profile_returns_complete_strengths_list(self, mock_db_client):
         """Test that retrieved profiles contain all 34 strengths."""
-        all_strengths = [f"Strength{i}" for i in range(1, 35)]
+        all_strengths = SAMPLE_STRENGTHS
         
-        mock_db_client.get_profile_by_name.return_value = {
+        mock_db_client.get_profile_by_name_ret = {
             "success": True,
             "count": 1,
             "message": "Found 1 profile(s)",
@@ -209,17 +181,9 @@ class TestGetProfileTool:
 class TestGetAllProfilesTool:
     """Test suite for the get_all_profiles tool."""
 
-    @pytest.fixture
-    def mock_db_client(self):
-        """Create a mock database client."""
-        with patch("strengths_agent.tools.get_db_client") as mock_get_client:
-            mock_client = MagicMock()
-            mock_get_client.return_value = mock_client
-            yield mock_client
-
     def test_get_all_profiles_success(self, mock_db_client):
         """Test retrieving all profiles successfully."""
-        mock_db_client.get_all_profiles.return_value = {
+        mock_db_client.get_all_profiles_ret = {
             "success": True,
             "count": 3,
             "message": "Retrieved 3 profile(s) from the database",
@@ -228,19 +192,19 @@ class TestGetAllProfilesTool:
                     "email_address": "alice@example.com",
                     "first_name": "Alice",
                     "last_name": "Smith",
-                    "strengths": [f"Strength{i}" for i in range(1, 35)],
+                    "strengths": SAMPLE_STRENGTHS,
                 },
                 {
                     "email_address": "bob@example.com",
                     "first_name": "Bob",
                     "last_name": "Jones",
-                    "strengths": ["Learner"] * 34,
+                    "strengths": LEARNER_34,
                 },
                 {
                     "email_address": "charlie@example.com",
                     "first_name": "Charlie",
                     "last_name": "Brown",
-                    "strengths": ["Achiever"] * 34,
+                    "strengths": ACHIEVER_34,
                 },
             ],
         }
@@ -254,7 +218,7 @@ class TestGetAllProfilesTool:
 
     def test_get_all_profiles_empty(self, mock_db_client):
         """Test retrieving all profiles when database is empty."""
-        mock_db_client.get_all_profiles.return_value = {
+        mock_db_client.get_all_profiles_ret = {
             "success": True,
             "count": 0,
             "message": "Retrieved 0 profile(s) from the database",
@@ -269,7 +233,7 @@ class TestGetAllProfilesTool:
 
     def test_get_all_profiles_error(self, mock_db_client):
         """Test handling of retrieval errors."""
-        mock_db_client.get_all_profiles.return_value = {
+        mock_db_client.get_all_profiles_ret = {
             "success": False,
             "message": "Error retrieving profiles: Database unavailable",
             "profiles": [],
@@ -283,7 +247,7 @@ class TestGetAllProfilesTool:
 
     def test_get_all_profiles_returns_complete_data(self, mock_db_client):
         """Test that all profiles contain required fields."""
-        mock_db_client.get_all_profiles.return_value = {
+        mock_db_client.get_all_profiles_ret = {
             "success": True,
             "count": 1,
             "message": "Retrieved 1 profile(s) from the database",
@@ -292,7 +256,7 @@ class TestGetAllProfilesTool:
                     "email_address": "test@example.com",
                     "first_name": "Test",
                     "last_name": "User",
-                    "strengths": [f"Strength{i}" for i in range(1, 35)],
+                    "strengths": SAMPLE_STRENGTHS,
                 }
             ],
         }